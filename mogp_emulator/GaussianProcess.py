@@ -4,7 +4,7 @@ from mogp_emulator.Kernel import Kernel, SquaredExponential, Matern52
 from mogp_emulator.Priors import Prior
 from scipy import linalg
 from scipy.optimize import OptimizeResult
-from mogp_emulator.linalg.cholesky import jit_cholesky
+from mogp_emulator.linalg.cholesky import jit_cholesky, cholesky_inverse
 
 class GaussianProcess(object):
     """
@@ -570,7 +570,7 @@ class GaussianProcess(object):
 
         if self.nugget_type == "fit":
             nugget = np.exp(self.theta[-1])
-            partials[-1] = 0.5*nugget*(np.trace(linalg.cho_solve((self.L, True), np.eye(self.n))) -
+            partials[-1] = 0.5*nugget*(np.trace(cholesky_inverse(self.L)) -
                                        np.dot(self.invQt, self.invQt))
 
         for i in range(self.n_params):
@@ -642,21 +642,15 @@ class GaussianProcess(object):
 
         if self.nugget_type == "fit":
             nugget = np.exp(self.theta[-1])
-            invQinvQt = linalg.cho_solve((self.L, True), self.invQt)
+            invQ = cholesky_inverse(self.L)
+            invQinvQt = np.dot(invQ, self.invQt)
             hessian[:switch, -1] = nugget*np.dot(dmdtheta, invQinvQt)
             for d in range(self.D + 1):
                 hessian[switch + d, -1] = nugget*(np.linalg.multi_dot([self.invQt, dKdtheta[d], invQinvQt]) -
-                                                  0.5*np.trace(linalg.cho_solve((self.L, True),
-                                                                                np.dot(dKdtheta[d],
-                                                                                       linalg.cho_solve((self.L, True),
-                                                                                                        np.eye(self.n))))))
-
-            hessian[-1, -1] = 0.5*nugget*(np.trace(linalg.cho_solve((self.L, True), np.eye(self.n))) -
-                                                   np.dot(self.invQt, self.invQt))
-            hessian[-1, -1] += nugget**2*(np.dot(self.invQt, invQinvQt) -
-                                          0.5*np.trace(linalg.cho_solve((self.L, True),
-                                                                        linalg.cho_solve((self.L, True),
-                                                                                         np.eye(self.n)))))
+                                                  0.5*np.trace(np.linalg.multi_dot([invQ, dKdtheta[d], invQ])))
+
+            hessian[-1, -1] = 0.5*nugget*(np.trace(invQ) - np.dot(self.invQt, self.invQt))
+            hessian[-1, -1] += nugget**2*(np.dot(self.invQt, invQinvQt) - 0.5*np.sum(invQ*invQ))
 
             hessian[-1, :-1] = np.transpose(hessian[:-1, -1])
 
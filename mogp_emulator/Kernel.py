@@ -7,6 +7,49 @@ kernel, but this can be changed once the ``GaussianProcess`` instance is created
 
 import numpy as np
 from scipy.spatial.distance import cdist
+try:
+    from numba import njit
+    no_numba = False
+except ImportError:
+    no_numba = True
+
+if not no_numba:
+    @njit(fastmath=True, cache=True)
+    def _squared_exponential_deriv(x1, x2, params, symmetric):
+        r"""
+        Compiled squared exponential kernel and gradient
+
+        Computes the squared exponential kernel and its derivatives with respect to the
+        hyperparameters in a single pass over all pairs of points, without forming any
+        intermediate distance arrays. If ``symmetric`` is ``True``, then ``x1`` and ``x2`` are
+        assumed to be the same array and only the lower triangle is computed and then mirrored.
+        Inputs must have already been checked using ``Kernel._check_inputs``. Only available
+        if numba is installed.
+        """
+
+        n1, D = x1.shape
+        n2 = x2.shape[0]
+
+        exp_theta = np.exp(params[:D])
+        sigma_2 = np.exp(params[D])
+
+        dKdtheta = np.empty((D + 1, n1, n2))
+
+        for i in range(n1):
+            jmax = i + 1 if symmetric else n2
+            for j in range(jmax):
+                r2 = 0.
+                for d in range(D):
+                    r2 += exp_theta[d]*(x1[i, d] - x2[j, d])**2
+                K = sigma_2*np.exp(-0.5*r2)
+                dKdtheta[D, i, j] = K
+                for d in range(D):
+                    dKdtheta[d, i, j] = -0.5*K*exp_theta[d]*(x1[i, d] - x2[j, d])**2
+                if symmetric:
+                    for d in range(D + 1):
+                        dKdtheta[d, j, i] = dKdtheta[d, i, j]
+
+        return dKdtheta
 
 class Kernel(object):
     r"""
@@ -152,6 +195,26 @@ class Kernel(object):
 
         return r_matrix
 
+    def _calc_dx(self, x1, x2):
+        r"""
+        Compute the component-wise differences between all pairs of points
+
+        Computes the difference between all pairs of points in ``x1`` and ``x2`` separately for
+        each input dimension using array broadcasting, so that the derivative computations can
+        operate on all dimensions at once rather than looping over them. Inputs must already
+        have been checked and reshaped using ``_check_inputs``.
+
+        :param x1: First input array with shape ``(n1, D - 1)``
+        :type x1: ndarray
+        :param x2: Second input array with shape ``(n2, D - 1)``
+        :type x2: ndarray
+        :returns: Array with shape ``(D - 1, n1, n2)`` holding the differences
+                  ``x1[i, d] - x2[j, d]`` at index ``[d, i, j]``.
+        :rtype: ndarray
+        """
+
+        return x1.T[:, :, None] - x2.T[:, None, :]
+
     def calc_drdtheta(self, x1, x2, params):
         r"""
         Calculate the first derivative of the distance between all pairs of points with
@@ -190,17 +253,12 @@ class Kernel(object):
 
         x1, n1, x2, n2, params, D = self._check_inputs(x1, x2, params)
 
-        exp_theta = np.exp(-params[:(D - 1)])
-
-        drdtheta = np.zeros((D - 1, n1, n2))
+        exp_theta = np.exp(params[:(D - 1)])
 
         r_matrix = self.calc_r(x1, x2, params)
         r_matrix[(r_matrix == 0.)] = 1.
 
-        for d in range(D - 1):
-            drdtheta[d] = (0.5 * np.exp(params[d]) / r_matrix *
-                           cdist(np.reshape(x1[:,d], (n1, 1)),
-                           np.reshape(x2[:,d], (n2, 1)), "sqeuclidean"))
+        drdtheta = 0.5 * exp_theta[:, None, None] * self._calc_dx(x1, x2)**2 / r_matrix
 
         return drdtheta
 
@@ -243,25 +301,17 @@ class Kernel(object):
 
         x1, n1, x2, n2, params, D = self._check_inputs(x1, x2, params)
 
-        exp_theta = np.exp(-params[:(D - 1)])
-
-        d2rdtheta2 = np.zeros((D - 1, D - 1, n1, n2))
+        exp_theta = np.exp(params[:(D - 1)])
 
         r_matrix = self.calc_r(x1, x2, params)
         r_matrix[(r_matrix == 0.)] = 1.
 
-        for d1 in range(D - 1):
-            for d2 in range(D - 1):
-                if d1 == d2:
-                    d2rdtheta2[d1, d2] = (0.5*np.exp(params[d1]) / r_matrix *
-                                          cdist(np.reshape(x1[:,d1], (n1, 1)),
-                                                np.reshape(x2[:,d1], (n2, 1)), "sqeuclidean"))
-                d2rdtheta2[d1, d2] -= (0.25 * np.exp(params[d1]) *
-                                       np.exp(params[d2]) / r_matrix**3 *
-                                       cdist(np.reshape(x1[:,d1], (n1, 1)),
-                                             np.reshape(x2[:,d1], (n2, 1)), "sqeuclidean")*
-                                       cdist(np.reshape(x1[:,d2], (n1, 1)),
-                                             np.reshape(x2[:,d2], (n2, 1)), "sqeuclidean"))
+        scaled_dx2 = exp_theta[:, None, None] * self._calc_dx(x1, x2)**2
+
+        d2rdtheta2 = -0.25 * scaled_dx2[:, None] * scaled_dx2[None, :] / r_matrix**3
+
+        diag = np.arange(D - 1)
+        d2rdtheta2[diag, diag] += 0.5 * scaled_dx2 / r_matrix
 
         return d2rdtheta2
 
@@ -303,16 +353,12 @@ class Kernel(object):
 
         x1, n1, x2, n2, params, D = self._check_inputs(x1, x2, params)
 
-        drdx = np.zeros((D - 1, n1, n2))
-
         exp_theta = np.exp(params[:(D - 1)])
 
         r_matrix = self.calc_r(x1, x2, params)
         r_matrix[(r_matrix == 0.)] = 1.
 
-        for d in range(D - 1):
-            drdx[d] = exp_theta[d]*(x1[:, d].flatten()[ :,    None ] -
-                                    x2[:, d].flatten()[ None, :    ])/r_matrix
+        drdx = exp_theta[:, None, None] * self._calc_dx(x1, x2) / r_matrix
 
         return drdx
 
@@ -392,8 +438,7 @@ class Kernel(object):
 
         drdtheta = self.calc_drdtheta(x1, x2, params)
 
-        for d in range(D - 1):
-            dKdtheta[d] = np.exp(params[-1]) * dKdr * drdtheta[d]
+        dKdtheta[:-1] = np.exp(params[-1]) * dKdr * drdtheta
 
         return dKdtheta
 
@@ -446,11 +491,9 @@ class Kernel(object):
         drdtheta = self.calc_drdtheta(x1, x2, params)
         d2rdtheta2 = self.calc_d2rdtheta2(x1, x2, params)
 
-        for d1 in range(D - 1):
-            for d2 in range(D - 1):
-                d2Kdtheta2[d1, d2] = np.exp(params[-1]) * (d2Kdr2 *
-                                                           drdtheta[d1] * drdtheta[d2] +
-                                                           dKdr * d2rdtheta2[d1, d2])
+        d2Kdtheta2[:-1, :-1] = np.exp(params[-1]) * (d2Kdr2 *
+                                                     drdtheta[:, None] * drdtheta[None, :] +
+                                                     dKdr * d2rdtheta2)
 
         return d2Kdtheta2
 
@@ -489,15 +532,12 @@ class Kernel(object):
 
         x1, n1, x2, n2, params, D = self._check_inputs(x1, x2, params)
 
-        dKdx = np.zeros((D - 1, n1, n2))
-
         r_matrix = self.calc_r(x1, x2, params)
         dKdr = self.calc_dKdr(r_matrix)
 
         drdx = self.calc_drdx(x1, x2, params)
 
-        for d in range(D - 1):
-            dKdx[d] = np.exp(params[-1]) * dKdr * drdx[d]
+        dKdx = np.exp(params[-1]) * dKdr * drdx
 
         return dKdx
 
@@ -606,6 +646,42 @@ class SquaredExponential(Kernel):
 
         return -r*np.exp(-0.5*r**2)
 
+    def kernel_deriv(self, x1, x2, params):
+        r"""
+        Compute squared exponential kernel gradient for a set of inputs
+
+        Returns the value of the kernel gradient for two sets of input points and a choice of
+        hyperparameters. If numba is installed, the kernel and all of its derivatives are
+        computed together with a compiled function that avoids building the intermediate
+        distance arrays (and only computes half of the entries if ``x1`` and ``x2`` are the
+        same array). Otherwise, this falls back to the generic stationary kernel implementation.
+        See ``Kernel.kernel_deriv`` for a description of the inputs and outputs.
+
+        :param x1: First input array.
+        :type x1: array-like
+        :param x2: Second input array.
+        :type x2: array-like
+        :param params: Hyperparameter array. Must be 1-D with length one greater than
+                       the last dimension of ``x1`` and ``x2``.
+        :type params: array-like
+        :returns: Array holding the gradient of the kernel function between points in arrays
+                  ``x1`` and ``x2`` with respect to the hyperparameters, with shape
+                  ``(D, n1, n2)``.
+        :rtype: ndarray
+        """
+
+        if no_numba:
+            return super().kernel_deriv(x1, x2, params)
+
+        symmetric = x1 is x2
+
+        x1, n1, x2, n2, params, D = self._check_inputs(x1, x2, params)
+
+        return _squared_exponential_deriv(np.ascontiguousarray(x1, dtype=np.float64),
+                                          np.ascontiguousarray(x2, dtype=np.float64),
+                                          np.ascontiguousarray(params, dtype=np.float64),
+                                          symmetric)
+
     def calc_d2Kdr2(self, r):
         r"""
         Calculate second derivative of the squared exponential kernel as a function of distance
@@ -4,6 +4,7 @@ from inspect import signature
 from mogp_emulator.ExperimentalDesign import ExperimentalDesign
 from mogp_emulator.GaussianProcess import GaussianProcess
 from mogp_emulator.fitting import fit_GP_MAP
+from mogp_emulator.linalg.cholesky import cholesky_inverse
 from numpy.linalg import LinAlgError
 
 class SequentialDesign(object):
@@ -739,7 +740,7 @@ class MICEFastGP(GaussianProcess):
                                      np.reshape(self.inputs[index, :], (1, self.D)),
                                      self.theta[switch:-1])
 
-        invQ = np.linalg.solve(self.L.T, np.linalg.solve(self.L, np.eye(self.n)))
+        invQ = cholesky_inverse(self.L)
         invQ_mod = (invQ[indices][:, indices] -
                     1./invQ[index, index]*np.outer(invQ[indices, index], invQ[indices, index]))
 
@@ -60,7 +60,9 @@ def jit_cholesky(A, maxtries = 5):
     assert int(maxtries) > 0, "maxtries must be a positive integer"
 
     A = np.ascontiguousarray(A)
-    L, info = lapack.dpotrf(A, lower = 1)
+    potrf, = lapack.get_lapack_funcs(("potrf",), (A,))
+
+    L, info = potrf(A, lower = 1)
     if info == 0:
         return L, 0.
     else:
@@ -68,13 +70,37 @@ def jit_cholesky(A, maxtries = 5):
         jitter = diagA.mean() * 1e-6
         num_tries = 1
         while num_tries <= maxtries and np.isfinite(jitter):
-            try:
-                L = linalg.cholesky(A + np.eye(A.shape[0]) * jitter, lower=True)
+            L, info = potrf(A + np.eye(A.shape[0]) * jitter, lower = 1, overwrite_a = 1)
+            if info == 0:
                 return L, jitter
-            except:
-                jitter *= 10
-            finally:
-                num_tries += 1
+            jitter *= 10
+            num_tries += 1
         raise linalg.LinAlgError("not positive definite, even with jitter.")
 
-    return L, jitter
+def cholesky_inverse(L):
+    """
+    Computes the inverse of a matrix from its Cholesky factor
+
+    Given the lower triangular Cholesky factor ``L`` of a symmetric positive definite matrix
+    ``A``, compute the inverse of ``A`` using the LAPACK routine ``potri``. This avoids
+    forming the inverse by solving against the identity matrix, roughly halving the number
+    of operations required. LAPACK only fills in the lower triangle of the inverse, so the
+    upper triangle is filled in by symmetry before returning.
+
+    :param L: Lower triangular Cholesky factor of the matrix to be inverted as an array
+              of shape ``(n,n)``.
+    :type L: ndarray
+    :returns: Inverse of the original matrix, an array of shape ``(n,n)``.
+    :rtype: ndarray
+    """
+
+    L = np.ascontiguousarray(L)
+    potri, = lapack.get_lapack_funcs(("potri",), (L,))
+
+    invA, info = potri(L, lower = 1)
+    if info != 0:
+        raise linalg.LinAlgError("Cholesky factor is singular, cannot compute inverse")
+
+    invA = np.tril(invA) + np.tril(invA, -1).T
+
+    return invA
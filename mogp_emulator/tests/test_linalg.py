@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy import linalg
+from ..linalg.cholesky import jit_cholesky, cholesky_inverse
+
+def test_jit_cholesky():
+    "test the jit_cholesky function"
+
+    A = np.array([[2., 1., 0.2], [1., 2., 0.4], [0.2, 0.4, 2.]])
+    L_expected = np.linalg.cholesky(A)
+
+    L_actual, jitter = jit_cholesky(A)
+    assert_allclose(L_expected, L_actual)
+    assert_allclose(jitter, 0.)
+
+    # singular matrix requires jitter to be added
+
+    A = np.array([[1., 1.], [1., 1.]])
+    L_actual, jitter = jit_cholesky(A)
+    assert jitter > 0.
+    assert_allclose(np.dot(L_actual, L_actual.T), A + jitter*np.eye(2))
+    assert_allclose(L_actual, np.tril(L_actual))
+
+    # matrix that cannot be stabilized
+
+    A = np.array([[1.e-6, 1.], [1., 1.e-6]])
+
+    with pytest.raises(linalg.LinAlgError):
+        jit_cholesky(A)
+
+    A = np.array([[1., 2.], [2., 1.]])
+
+    with pytest.raises(linalg.LinAlgError):
+        jit_cholesky(A, maxtries=1)
+
+    with pytest.raises(AssertionError):
+        jit_cholesky(np.ones((2, 3)))
+
+    with pytest.raises(AssertionError):
+        jit_cholesky(A, maxtries=0)
+
+def test_cholesky_inverse():
+    "test the cholesky_inverse function"
+
+    A = np.array([[2., 1., 0.2], [1., 2., 0.4], [0.2, 0.4, 2.]])
+    L = np.linalg.cholesky(A)
+
+    invA = cholesky_inverse(L)
+    assert_allclose(invA, np.linalg.inv(A), atol=1.e-12)
+    assert_allclose(invA, invA.T)
+
+    with pytest.raises(linalg.LinAlgError):
+        cholesky_inverse(np.array([[1., 0.], [1., 0.]]))
@@ -0,0 +1,5 @@
+'''
+Version file automatically created by setup.py file
+'''
+version = '0.4.0'
+    
\ No newline at end of file